@@ -440,7 +440,7 @@ if st.session_state.auth_config_created and st.session_state.application_id:
                     status_container = st.container()
                     
                     # Push with detailed status
-                    success = st.session_state.github_manager.push_zip_to_repo(
+                    success = st.session_state.github_manager.push_zip_via_git_data(
                         repo_owner="QuCoon-ML-AI",
                         repo_name=application_name,
                         zip_content=zip_content,
@@ -1,10 +1,104 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import zipfile
 import io
 import re
-from typing import Optional
+from typing import Optional, Union
 import os
 import base64
+import orjson
+import concurrent.futures
+import contextlib
+import functools
+import multiprocessing
+import time
+import random
+import logging
+
+log = logging.getLogger(__name__)
+
+# Parallel blob uploads; kept low to stay under GitHub's secondary rate limits
+MAX_UPLOAD_WORKERS = 12
+
+# Contents API writes each commit to the branch head, so parallel writers conflict (409)
+# and are retried with jittered backoff; this path is best-effort, see push_zip_to_repo
+CONTENTS_UPLOAD_WORKERS = 3
+_CONFLICT_RETRIES = 5
+_CONFLICT_BACKOFF = 0.5
+
+# Git Data API commit batch sizes; GitHub aborts tree/commit calls after ~60 seconds
+_BATCH_SCALE = [20, 50, 75, 100, 125, 150, 200, 250, 400, 600, 1000]
+_BATCH_FAST_SECONDS = 40
+_COMMIT_TIMEOUT = 60
+
+# All sensitive names share one alternation, so content is scanned once however many there are
+_SENSITIVE_VARS = ("authKey",)
+_SENSITIVE_MARKERS = tuple(var.encode('utf-8') for var in _SENSITIVE_VARS)
+_SENSITIVE_PATTERN = re.compile(
+    rf'((?:{"|".join(map(re.escape, _SENSITIVE_VARS))})\s*=\s*)(["\'].*?["\']|\S+)'
+)
+_LANG_REPLACEMENTS = {
+    '.kt': 'System.getenv("REPLACEMENT_KEY")',
+    '.java': 'System.getenv("REPLACEMENT_KEY")',
+    '.py': 'os.getenv("REPLACEMENT_KEY")',
+    '.js': 'process.env.REPLACEMENT_KEY',
+    '.ts': 'process.env.REPLACEMENT_KEY'
+}
+
+# Bytes treated as text by the binary heuristic (same set git uses)
+_TEXT_CHARS = bytes({7, 8, 9, 10, 11, 12, 13, 27} | set(range(0x20, 0x7f)) | set(range(0x80, 0x100)))
+_BINARY_SAMPLE_SIZE = 8192
+
+# Extensions whose text/binary nature is known without scanning the content
+_TEXT_EXTS = frozenset({
+    '.py', '.js', '.ts', '.java', '.kt', '.md', '.txt', '.json', '.yaml', '.yml', '.xml',
+    '.html', '.css', '.toml', '.ini', '.cfg', '.sh', '.sql', '.go', '.rs', '.c', '.h',
+    '.cpp', '.hpp'
+})
+_BINARY_EXTS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.pdf', '.zip', '.jar', '.class', '.so', '.dll',
+    '.exe', '.bin', '.ico', '.mp4', '.webp'
+})
+
+# Members above this size are base64-encoded straight from the ZIP stream
+_LARGE_FILE_THRESHOLD = 16 * 1024 * 1024
+_STREAM_CHUNK_SIZE = 3 * 64 * 1024  # multiple of 3 so chunks encode without padding
+
+# Pushes above this many raw bytes are encoded in a few worker processes
+_PROCESS_POOL_THRESHOLD = 50 * 1024 * 1024
+_ENCODE_WORKERS = 4
+
+class _Base64Buffer(bytearray):
+    """base64 output for a ZIP member that was encoded while streaming"""
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+def _encode_json_body(data: dict) -> bytes:
+    """Serialize a JSON request body with orjson, splicing base64 bytes values in directly"""
+    if not any(isinstance(value, (bytes, bytearray)) for value in data.values()):
+        return orjson.dumps(data)
+
+    # base64 output is plain ASCII and never needs JSON escaping; collecting fragments
+    # for a single join copies the payload exactly once
+    parts = [b'{']
+    for key, value in data.items():
+        if len(parts) > 1:
+            parts.append(b',')
+        parts.append(orjson.dumps(key))
+        if isinstance(value, (bytes, bytearray)):
+            parts.extend((b':"', value, b'"'))
+        else:
+            parts.extend((b':', orjson.dumps(value)))
+    parts.append(b'}')
+    return b''.join(parts)
+
+def _is_server_slowdown(error: requests.exceptions.RequestException) -> bool:
+    """Check whether a request failed from a timeout or 5xx rather than a client error"""
+    if isinstance(error, (requests.exceptions.Timeout, requests.exceptions.RetryError)):
+        return True
+    response = getattr(error, "response", None)
+    return response is not None and response.status_code >= 500
 
 class GitHubManager:
     def __init__(self, token: str):
@@ -14,37 +108,42 @@ class GitHubManager:
             "Accept": "application/vnd.github.v3+json"
         }
         self.api_base = "https://api.github.com"
+        self._default_branches = {}
+
+        # Reuse one keep-alive connection pool across all API calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                                                   max_retries=retries))
+
+    def close(self):
+        """Close pooled connections held by the HTTP session"""
+        self.session.close()
         
-    def _clean_code_content(self, content: str, file_extension: str) -> str:
+    @staticmethod
+    def _clean_code_content(content: str, file_extension: str) -> str:
         """Clean sensitive data from code content in-memory"""
-        sensitive_var = "authKey"
-        replacements = {
-            '.kt': 'System.getenv("REPLACEMENT_KEY")',
-            '.java': 'System.getenv("REPLACEMENT_KEY")',
-            '.py': 'os.getenv("REPLACEMENT_KEY")',
-            '.js': 'process.env.REPLACEMENT_KEY',
-            '.ts': 'process.env.REPLACEMENT_KEY'
-        }
-
-        pattern = re.compile(rf'({sensitive_var}\s*=\s*)(["\'].*?["\']|\S+)')
-        if replacement := replacements.get(file_extension):
-            return pattern.sub(rf'\1{replacement}', content)
-        return content
+        replacement = _LANG_REPLACEMENTS.get(file_extension)
+        # Cheap checks first so unaffected files never reach the regex engine
+        if not replacement or not any(var in content for var in _SENSITIVE_VARS):
+            return content
+        return _SENSITIVE_PATTERN.sub(rf'\1{replacement}', content)
 
-    def create_repository(self, repo_name: str, private: bool = False) -> Optional[str]:
+    def create_repository(self, repo_name: str, private: bool = False,
+                          auto_init: bool = False) -> Optional[str]:
         """Create a new GitHub repository"""
         url = f"{self.api_base}/user/repos"
-        print(url)
-        data = {"name": repo_name, "private": private}
-        print(data)
-        
-        
+        data = {"name": repo_name, "private": private, "auto_init": auto_init}
+        log.debug("create_repo url=%s name=%s", url, data["name"])
+
         try:
-            response = requests.post(url, json=data, headers=self.headers)
+            response = self.session.post(url, data=_encode_json_body(data),
+                                         headers=_JSON_HEADERS)
             response.raise_for_status()
             return response.json()['html_url']
         except requests.exceptions.RequestException as e:
-            print(f"Repository creation failed: {str(e)}")
+            log.warning("Repository creation failed: %s", e)
             return None
 
     def create_file(self, repo_owner: str, repo_name: str, 
@@ -56,30 +155,47 @@ class GitHubManager:
         url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/contents/{file_path}"
         data = {
             "message": message,
-            "content": base64.b64encode(content.encode('utf-8')).decode('ascii'),
+            "content": base64.b64encode(content.encode('utf-8')),
             "encoding": "base64"
         }
 
         try:
-            response = requests.put(url, json=data, headers=self.headers)
+            response = self.session.put(url, data=_encode_json_body(data),
+                                        headers=_JSON_HEADERS)
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            print(f"File creation failed for {file_path}: {str(e)}")
+            log.warning("File creation failed for %s: %s", file_path, e)
             return False
     
-    def _is_binary(self, content: bytes) -> bool:
-        """Check if content is likely binary by looking for null bytes or high concentration of non-ASCII chars"""
+    @staticmethod
+    def _is_binary(content: bytes) -> bool:
+        """Check if content is likely binary by looking for null bytes or high concentration of control chars"""
+        # Only the leading block is sampled, as git and file(1) do
+        sample = content[:_BINARY_SAMPLE_SIZE]
+        if not sample:
+            return False
+
         # Check for null bytes which indicate binary content
-        if b'\x00' in content:
+        if b'\x00' in sample:
             return True
-        
-        # Check text/binary ratio
-        text_chars = len([b for b in content if 32 <= b <= 127 or b in (9, 10, 13)])
-        return text_chars / len(content) < 0.7 if content else False
+
+        # Check text/binary ratio; translate() strips text bytes in C
+        non_text_chars = len(sample.translate(None, _TEXT_CHARS))
+        return non_text_chars / len(sample) > 0.3
+
+    @classmethod
+    def _is_binary_file(cls, file_path: str, content: bytes) -> bool:
+        """Check if a file is binary, trusting well-known extensions before scanning content"""
+        file_ext = os.path.splitext(file_path)[1].lower()
+        if file_ext in _BINARY_EXTS:
+            return True
+        if file_ext in _TEXT_EXTS:
+            return False
+        return cls._is_binary(content)
 
     def create_file_with_encoding(self, repo_owner: str, repo_name: str, 
-                    file_path: str, content: str, encoding: str,
+                    file_path: str, content: Union[str, bytes, bytearray], encoding: str,
                     message: str = "Initial commit") -> bool:
         """Create a file in a GitHub repository with specified encoding"""
         url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/contents/{file_path}"
@@ -88,20 +204,120 @@ class GitHubManager:
             "content": content,
             "encoding": encoding
         }
+        body = _encode_json_body(data)
 
         try:
-            response = requests.put(url, json=data, headers=self.headers)
+            # Parallel writers race on the branch head; retry conflicts at jittered times
+            for attempt in range(_CONFLICT_RETRIES + 1):
+                response = self.session.put(url, data=body, headers=_JSON_HEADERS)
+                if response.status_code != 409 or attempt == _CONFLICT_RETRIES:
+                    break
+                time.sleep(random.uniform(0, _CONFLICT_BACKOFF * 2 ** attempt))
             response.raise_for_status()
             return True
         except requests.exceptions.RequestException as e:
-            print(f"File creation failed for {file_path}: {str(e)}")
+            log.warning("File creation failed for %s: %s", file_path, e)
             return False
 
+    def create_blob(self, repo_owner: str, repo_name: str,
+                    content: Union[str, bytes, bytearray], encoding: str) -> Optional[str]:
+        """Create a Git blob and return its SHA"""
+        data = {"content": content, "encoding": encoding}
+
+        try:
+            return self._post_git_data(repo_owner, repo_name, "blobs", data)
+        except requests.exceptions.RequestException as e:
+            log.warning("Blob creation failed: %s", e)
+            return None
+
+    def _post_git_data(self, repo_owner: str, repo_name: str, endpoint: str,
+                       data: dict, timeout: Optional[float] = None) -> str:
+        """POST to a Git Data endpoint and return the new object's SHA, raising on failure"""
+        url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/git/{endpoint}"
+        response = self.session.post(url, data=_encode_json_body(data),
+                                     headers=_JSON_HEADERS, timeout=timeout)
+        response.raise_for_status()
+        return response.json()['sha']
+
+    def update_ref(self, repo_owner: str, repo_name: str,
+                   branch: str, commit_sha: str) -> bool:
+        """Move a branch to point at the given commit"""
+        url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/git/refs/heads/{branch}"
+        data = {"sha": commit_sha}
+
+        try:
+            response = self.session.patch(url, data=_encode_json_body(data),
+                                          headers=_JSON_HEADERS)
+            response.raise_for_status()
+            return True
+        except requests.exceptions.RequestException as e:
+            log.warning("Ref update failed for %s: %s", branch, e)
+            return False
+
+    def _ensure_repository(self, repo_owner: str, repo_name: str,
+                           auto_init: bool = False) -> Optional[bool]:
+        """Create the repository unless it exists; True if created, False if reused, None on failure"""
+        # Retried pushes reuse the repo instead of a POST that would 422
+        if self._repo_exists(repo_owner, repo_name):
+            return False
+        if not self.create_repository(repo_name, private=False, auto_init=auto_init):
+            return None
+        return True
+
+    def _repo_exists(self, repo_owner: str, repo_name: str) -> bool:
+        """Check whether a repository exists with a HEAD request"""
+        url = f"{self.api_base}/repos/{repo_owner}/{repo_name}"
+
+        try:
+            return self.session.head(url).status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    def _get_default_branch(self, repo_owner: str, repo_name: str) -> str:
+        """Get a repository's default branch name, cached per repository"""
+        key = (repo_owner, repo_name)
+        if key not in self._default_branches:
+            # Raises instead of returning None so failed lookups are not cached
+            url = f"{self.api_base}/repos/{repo_owner}/{repo_name}"
+            response = self.session.get(url)
+            response.raise_for_status()
+            self._default_branches[key] = response.json()['default_branch']
+        return self._default_branches[key]
+
+    def _get_branch_head(self, repo_owner: str, repo_name: str,
+                         branch: str) -> Optional[str]:
+        """Get the commit SHA a branch currently points at"""
+        url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/git/ref/heads/{branch}"
+
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response.json()['object']['sha']
+        except requests.exceptions.RequestException as e:
+            log.warning("Branch lookup failed for %s: %s", branch, e)
+            return None
+
+    def _get_commit_tree(self, repo_owner: str, repo_name: str,
+                         commit_sha: str) -> Optional[str]:
+        """Get the tree SHA of a commit"""
+        url = f"{self.api_base}/repos/{repo_owner}/{repo_name}/git/commits/{commit_sha}"
+
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            return response.json()['tree']['sha']
+        except requests.exceptions.RequestException as e:
+            log.warning("Commit lookup failed for %s: %s", commit_sha, e)
+            return None
+
     # In GitHubManager class
     def push_zip_to_repo(self, repo_owner: str, repo_name: str, 
                         zip_content: bytes, commit_message: str = "Initial commit",
                         status_container=None) -> bool:
         """Push zip content directly to GitHub repository with detailed status"""
+        # Best-effort fallback: concurrent Contents API writes can still exhaust their
+        # conflict retries, and those files are reported as skipped
+
         # Create status columns if container provided
         if status_container:
             col1, col2, col3 = status_container.columns([3, 5, 2])
@@ -109,80 +325,176 @@ class GitHubManager:
             col2.markdown("**Status**")
             col3.markdown("**Progress**")
         
-        total_files = 0
         success_count = 0
         error_count = 0
-        
-        # First pass to count files
-        with zipfile.ZipFile(io.BytesIO(zip_content), 'r') as zip_ref:
-            total_files = sum(1 for f in zip_ref.infolist() if not f.is_dir())
-        
-        # Create repository first
-        if status_container:
-            status_container.info(f"📦 Creating repository {repo_name}...")
-        if not self.create_repository(repo_name, private=False):
+
+        # Process zip file in memory
+        try:
+            entries = self._read_zip_entries(zip_content, repo_name)
+            total_files = len(entries)
+
+            # Create repository first
             if status_container:
-                status_container.error("Repository creation failed!")
+                status_container.info(f"📦 Creating repository {repo_name}...")
+            if self._ensure_repository(repo_owner, repo_name) is None:
+                if status_container:
+                    status_container.error("Repository creation failed!")
+                return False
+
+            progress_bar = status_container.progress(0) if status_container else None
+
+            # Create status rows (Streamlit calls must stay on this thread)
+            status_placeholders = {}
+            if status_container:
+                for file_info, _ in entries:
+                    file_col, status_col, _ = status_container.columns([3, 5, 2])
+                    file_col.markdown(f"`{self._clean_file_path(file_info.filename, repo_name)}`")
+                    status_placeholder = status_col.empty()
+                    status_placeholder.info("⏳ Queued...")
+                    status_placeholders[file_info.filename] = status_placeholder
+
+            upload = functools.partial(self._upload_file, repo_owner, repo_name,
+                                       commit_message=commit_message)
+            current_file = 0
+
+            for file_info, future in self._run_uploads(entries, repo_name,
+                                                       CONTENTS_UPLOAD_WORKERS, upload):
+                current_file += 1
+                status_placeholder = status_placeholders.get(file_info.filename)
+                self._update_progress(progress_bar, current_file, total_files)
+
+                try:
+                    success = future.result()
+
+                    if success:
+                        success_count += 1
+                        if status_placeholder:
+                            status_placeholder.success("✅ Uploaded")
+                    else:
+                        error_count += 1
+                        if status_placeholder:
+                            status_placeholder.warning("⚠️ Skipped")
+
+                except Exception as e:
+                    error_count += 1
+                    if status_placeholder:
+                        status_placeholder.error(f"❌ Failed: {str(e)}")
+                    continue
+
+            # Final status
+            if status_container:
+                progress_bar.empty()
+                status_container.success(f"""
+                    🚀 Push completed!
+                    - Successfully uploaded: {success_count} files
+                    - Skipped/Failed: {error_count} files
+                    Repository: https://github.com/{repo_owner}/{repo_name}
+                """)
+
+            return True
+
+        except zipfile.BadZipFile:
+            if status_container:
+                status_container.error("❌ Invalid ZIP file format")
+            return False
+        except Exception as e:
+            if status_container:
+                status_container.error(f"❌ Error processing ZIP file: {str(e)}")
             return False
+        finally:
+            self.close()
+
+    def push_zip_via_git_data(self, repo_owner: str, repo_name: str,
+                              zip_content: bytes, commit_message: str = "Initial commit",
+                              status_container=None, branch: Optional[str] = None) -> bool:
+        """Push zip content as a single commit using the Git Data API"""
+        success_count = 0
+        error_count = 0
 
-        # Process zip file in memory
         try:
-            with zipfile.ZipFile(io.BytesIO(zip_content), 'r') as zip_ref:
-                progress_bar = status_container.progress(0) if status_container else None
-                current_file = 0
-                
-                for file_info in zip_ref.infolist():
-                    if file_info.is_dir():
-                        continue
-
-                    current_file += 1
-                    file_path = self._clean_file_path(file_info.filename, repo_name)
-                    if not file_path:
-                        continue
-
-                    # Update progress
+            entries = self._read_zip_entries(zip_content, repo_name)
+
+            # The Git Data API rejects empty repositories, so seed one initial commit
+            if status_container:
+                status_container.info(f"📦 Creating repository {repo_name}...")
+            repo_created = self._ensure_repository(repo_owner, repo_name, auto_init=True)
+            if repo_created is None:
+                if status_container:
+                    status_container.error("Repository creation failed!")
+                return False
+
+            branch = branch or self._get_default_branch(repo_owner, repo_name)
+            parent_sha = self._get_branch_head(repo_owner, repo_name, branch)
+            if not parent_sha:
+                if status_container:
+                    status_container.error(f"❌ Could not read branch {branch}")
+                return False
+
+            # Only the seeded tree of a repo created just now may be replaced wholesale;
+            # an existing repo's files are kept by building on its head tree
+            base_tree = None
+            if not repo_created:
+                base_tree = self._get_commit_tree(repo_owner, repo_name, parent_sha)
+                if not base_tree:
                     if status_container:
-                        progress = current_file / total_files
-                        progress_bar.progress(min(progress, 1.0))
+                        status_container.error(f"❌ Could not read branch {branch}")
+                    return False
+
+            total_files = len(entries)
+            progress_bar = status_container.progress(0) if status_container else None
+            if status_container:
+                status_container.info(f"⬆️ Uploading {total_files} files...")
+
+            tree = []
+            upload = functools.partial(self._upload_blob, repo_owner, repo_name)
+            current_file = 0
+
+            for file_info, future in self._run_uploads(entries, repo_name, MAX_UPLOAD_WORKERS,
+                                                       upload, allow_utf8=True):
+                current_file += 1
+                self._update_progress(progress_bar, current_file, total_files)
 
-                    # Create status row
+                try:
+                    blob_sha = future.result()
+                except Exception:
+                    blob_sha = None
+
+                if not blob_sha:
+                    error_count += 1
                     if status_container:
-                        file_col, status_col, _ = status_container.columns([3, 5, 2])
-                        file_col.markdown(f"`{file_path}`")
-                        status_placeholder = status_col.empty()
-
-                    try:
-                        # File processing logic...
-                        success = self._process_file(repo_owner, repo_name, file_info, 
-                                                zip_ref, commit_message, status_placeholder)
-                        
-                        if success:
-                            success_count += 1
-                            if status_container:
-                                status_placeholder.success("✅ Uploaded")
-                        else:
-                            error_count += 1
-                            if status_container:
-                                status_placeholder.warning("⚠️ Skipped")
-
-                    except Exception as e:
-                        error_count += 1
-                        if status_container:
-                            status_placeholder.error(f"❌ Failed: {str(e)}")
-                        continue
+                        status_container.warning(f"⚠️ Skipped `{file_info.filename}`")
+                    continue
+
+                success_count += 1
+                tree.append({
+                    "path": self._clean_file_path(file_info.filename, repo_name),
+                    "mode": self._file_mode(file_info),
+                    "type": "blob",
+                    "sha": blob_sha
+                })
+
+            if status_container:
+                progress_bar.empty()
+                status_container.info("📝 Creating commits...")
 
-                # Final status
+            commit_sha = self._commit_tree_in_batches(repo_owner, repo_name, tree,
+                                                      commit_message, parent_sha, base_tree)
+            if not commit_sha or not self.update_ref(repo_owner, repo_name, branch, commit_sha):
                 if status_container:
-                    progress_bar.empty()
-                    status_container.success(f"""
-                        🚀 Push completed!
-                        - Successfully uploaded: {success_count} files
-                        - Skipped/Failed: {error_count} files
-                        Repository: https://github.com/{repo_owner}/{repo_name}
-                    """)
-                    
-                return True
-                
+                    status_container.error("❌ Commit creation failed!")
+                return False
+
+            # Final status
+            if status_container:
+                status_container.success(f"""
+                    🚀 Push completed!
+                    - Successfully uploaded: {success_count} files
+                    - Skipped/Failed: {error_count} files
+                    Repository: https://github.com/{repo_owner}/{repo_name}
+                """)
+
+            return True
+
         except zipfile.BadZipFile:
             if status_container:
                 status_container.error("❌ Invalid ZIP file format")
@@ -191,8 +503,57 @@ class GitHubManager:
             if status_container:
                 status_container.error(f"❌ Error processing ZIP file: {str(e)}")
             return False
+        finally:
+            self.close()
+
+    def _commit_tree_in_batches(self, repo_owner, repo_name, tree, commit_message,
+                                parent_sha, base_tree=None) -> Optional[str]:
+        """Commit tree entries in adaptively sized batches and return the last commit SHA"""
+        # Batches grow while commits are fast and shrink when one times out or hits a 5xx
+        scale_index = 1
+        start = 0
+
+        while start < len(tree):
+            batch = tree[start:start + _BATCH_SCALE[scale_index]]
+            tree_data = {"tree": batch}
+            if base_tree:
+                tree_data["base_tree"] = base_tree
+
+            started = time.monotonic()
+            try:
+                tree_sha = self._post_git_data(repo_owner, repo_name, "trees", tree_data,
+                                               timeout=_COMMIT_TIMEOUT)
+                commit_data = {"message": commit_message, "tree": tree_sha,
+                               "parents": [parent_sha]}
+                commit_sha = self._post_git_data(repo_owner, repo_name, "commits", commit_data,
+                                                 timeout=_COMMIT_TIMEOUT)
+            except requests.exceptions.RequestException as e:
+                # Deterministic errors (e.g. 422 for a bad entry) won't improve with smaller batches
+                if scale_index == 0 or not _is_server_slowdown(e):
+                    log.warning("Batch commit failed: %s", e)
+                    return None
+                scale_index = max(0, scale_index - 2)
+                continue
+            elapsed = time.monotonic() - started
+
+            # Without a base tree the first batch replaces the tree; later ones build on it
+            start += len(batch)
+            parent_sha = commit_sha
+            base_tree = tree_sha
+            if elapsed < _BATCH_FAST_SECONDS:
+                scale_index = min(len(_BATCH_SCALE) - 1, scale_index + 1)
+
+        return parent_sha
 
     # Helper methods
+    def _update_progress(self, progress_bar, current_file, total_files):
+        """Advance the progress bar, at most ~100 times to avoid flooding Streamlit"""
+        if not progress_bar:
+            return
+        progress_step = max(1, total_files // 100)
+        if current_file % progress_step == 0 or current_file == total_files:
+            progress_bar.progress(min(current_file / total_files, 1.0))
+
     def _clean_file_path(self, path: str, repo_name: str) -> str:
         """Clean file paths from ZIP structure"""
         parts = path.split('/')
@@ -200,39 +561,139 @@ class GitHubManager:
             return '/'.join(parts[1:])
         return path
 
-    def _process_file(self, repo_owner, repo_name, file_info, zip_ref, 
-                    commit_message, status_placeholder):
-        """Process individual file with status updates"""
+    def _read_zip_entries(self, zip_content: bytes, repo_name: str) -> list:
+        """Read all file members of a ZIP in one pass as (file_info, bytes) tuples"""
+        # Members are read up front because ZipFile handles are not thread-safe
+        entries = []
+        with zipfile.ZipFile(io.BytesIO(zip_content), 'r') as zip_ref:
+            for file_info in zip_ref.infolist():
+                if file_info.is_dir():
+                    continue
+                if not self._clean_file_path(file_info.filename, repo_name):
+                    continue
+                if (file_info.file_size > _LARGE_FILE_THRESHOLD
+                        and self._can_stream_member(file_info, repo_name)):
+                    entries.append((file_info, self._stream_base64(zip_ref, file_info)))
+                    continue
+                with zip_ref.open(file_info) as src:
+                    entries.append((file_info, src.read()))
+        return entries
+
+    def _can_stream_member(self, file_info, repo_name) -> bool:
+        """Check whether a member can skip cleaning and be encoded while streaming"""
         file_path = self._clean_file_path(file_info.filename, repo_name)
-        content = zip_ref.read(file_info)
-        
-        if status_placeholder:
-            status_placeholder.info("🔍 Analyzing file...")
-        
+        return os.path.splitext(file_path)[1] not in _LANG_REPLACEMENTS
+
+    def _stream_base64(self, zip_ref, file_info) -> _Base64Buffer:
+        """Base64-encode a ZIP member chunk by chunk without holding its raw bytes"""
+        encoded = _Base64Buffer(4 * ((file_info.file_size + 2) // 3))
+        offset = 0
+        remainder = b''
+        with zip_ref.open(file_info) as src:
+            while chunk := src.read(_STREAM_CHUNK_SIZE):
+                chunk = remainder + chunk
+                usable = len(chunk) - len(chunk) % 3
+                remainder = chunk[usable:]
+                block = base64.b64encode(chunk[:usable])
+                encoded[offset:offset + len(block)] = block
+                offset += len(block)
+        block = base64.b64encode(remainder)
+        encoded[offset:offset + len(block)] = block
+        return encoded
+
+    def _file_mode(self, file_info) -> str:
+        """Git file mode for a ZIP member, keeping the executable bit"""
+        if (file_info.external_attr >> 16) & 0o111:
+            return "100755"
+        return "100644"
+
+    @classmethod
+    def _encode_file_bytes(cls, file_path, content, allow_utf8=False):
+        """Clean and encode file bytes, returning (encoded_content, encoding)"""
+        # A classmethod so worker processes can run it without pickling the session
+        # Large members were already encoded while reading the ZIP
+        if isinstance(content, _Base64Buffer):
+            return content, "base64"
+
         # Binary check
-        if self._is_binary(content):
-            if status_placeholder:
-                status_placeholder.info("📦 Detected binary file...")
-            encoded_content = base64.b64encode(content).decode('ascii')
-            encoding = "base64"
-        else:
-            if status_placeholder:
-                status_placeholder.info("📝 Processing text file...")
-            try:
-                decoded_content = content.decode('utf-8')
-                file_ext = os.path.splitext(file_path)[1]
-                cleaned_content = self._clean_code_content(decoded_content, file_ext)
-                encoded_content = base64.b64encode(cleaned_content.encode('utf-8')).decode('ascii')
-                encoding = "base64"
-            except UnicodeDecodeError:
-                if status_placeholder:
-                    status_placeholder.warning("⚠️ Fallback to binary encoding")
-                encoded_content = base64.b64encode(content).decode('ascii')
-                encoding = "base64"
-
-        # Create file
-        if status_placeholder:
-            status_placeholder.info("⬆️ Uploading...")
-        return self.create_file_with_encoding(repo_owner, repo_name, 
-                                            file_path, encoded_content, encoding,
-                                            commit_message)
\ No newline at end of file
+        if cls._is_binary_file(file_path, content):
+            return base64.b64encode(content), "base64"
+
+        # Nothing to clean, so the bytes go out unchanged without a decode round trip
+        file_ext = os.path.splitext(file_path)[1]
+        needs_cleaning = (file_ext in _LANG_REPLACEMENTS
+                          and any(marker in content for marker in _SENSITIVE_MARKERS))
+        if not needs_cleaning and not allow_utf8:
+            return base64.b64encode(content), "base64"
+
+        try:
+            decoded_content = content.decode('utf-8')
+        except UnicodeDecodeError:
+            # Fallback to binary encoding
+            return base64.b64encode(content), "base64"
+
+        if needs_cleaning:
+            decoded_content = cls._clean_code_content(decoded_content, file_ext)
+        # The blobs endpoint accepts raw UTF-8 text; the Contents API only takes base64
+        if allow_utf8:
+            return decoded_content, "utf-8"
+        return base64.b64encode(decoded_content.encode('utf-8')), "base64"
+
+    def _start_encode_pool(self, entries):
+        """Start worker processes for encoding a large push, or a no-op context for small ones"""
+        total_size = sum(len(content) for _, content in entries
+                         if not isinstance(content, _Base64Buffer))
+
+        # Small pushes are not worth the IPC cost of worker processes
+        if total_size < _PROCESS_POOL_THRESHOLD:
+            return contextlib.nullcontext()
+
+        # Forking from Streamlit's threaded script runner is unsafe, so start clean processes
+        start_method = "spawn"
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            start_method = "forkserver"
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=_ENCODE_WORKERS, mp_context=multiprocessing.get_context(start_method)
+        )
+
+    def _run_uploads(self, entries, repo_name, max_workers, upload, allow_utf8=False):
+        """Encode and upload entries in parallel, yielding (file_info, future) as each finishes"""
+        # upload is called as upload(file_path=..., content=..., encode_future=...)
+        with self._start_encode_pool(entries) as encode_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for file_info, content in entries:
+                file_path = self._clean_file_path(file_info.filename, repo_name)
+                encode_future = self._submit_encode(encode_pool, file_path, content, allow_utf8)
+                future = executor.submit(upload, file_path=file_path, content=content,
+                                         encode_future=encode_future)
+                futures[future] = file_info
+
+            for future in concurrent.futures.as_completed(futures):
+                yield futures[future], future
+
+    def _submit_encode(self, encode_pool, file_path, content, allow_utf8=False):
+        """Queue encoding on the worker processes, or return None to encode in the upload task"""
+        if encode_pool is None or isinstance(content, _Base64Buffer):
+            return None
+        return encode_pool.submit(self._encode_file_bytes, file_path, content, allow_utf8)
+
+    def _encode_entry(self, file_path, content, allow_utf8=False, encode_future=None):
+        """Encode one entry, waiting on its worker process result when it has one"""
+        if encode_future is not None:
+            return encode_future.result()
+        return self._encode_file_bytes(file_path, content, allow_utf8)
+
+    def _upload_file(self, repo_owner, repo_name, file_path, content, commit_message,
+                     encode_future=None):
+        """Encode a single file and upload it through the Contents API"""
+        encoded_content, encoding = self._encode_entry(file_path, content,
+                                                       encode_future=encode_future)
+        return self.create_file_with_encoding(repo_owner, repo_name, file_path,
+                                              encoded_content, encoding, commit_message)
+
+    def _upload_blob(self, repo_owner, repo_name, file_path, content, encode_future=None):
+        """Encode a single file and upload it as a Git blob"""
+        encoded_content, encoding = self._encode_entry(file_path, content, allow_utf8=True,
+                                                       encode_future=encode_future)
+        return self.create_blob(repo_owner, repo_name, encoded_content, encoding)
@@ -1,6 +1,7 @@
 import boto3, json
 import os
 from qooneous import qoonity_head
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 session = boto3.Session()
@@ -9,7 +10,16 @@ aws_access_key_id = os.getenv("aws_access_key_id")
 aws_secret_access_key = os.getenv("aws_secret_access_key")
 region_name = os.getenv("region_name")
 
-bedrock = session.client(service_name='bedrock-runtime', region_name="us-east-1", aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key)
+# Larger pool so concurrent Streamlit sessions don't queue on the default 10 connections
+bedrock_config = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    read_timeout=120,
+    connect_timeout=10,
+    tcp_keepalive=True
+)
+
+bedrock = session.client(service_name='bedrock-runtime', region_name="us-east-1", aws_access_key_id=aws_access_key_id, aws_secret_access_key=aws_secret_access_key, config=bedrock_config)
 modelId = "anthropic.claude-3-5-sonnet-20240620-v1:0"
 
 tool_list = [
@@ -149,31 +159,38 @@ tool_list = [
     
 ]
 
-# Function to fetch a response from the model
-def get_completion(prompt, chat_history=None, system_prompt=None):
-    inference_config = {
+# Static part of every converse request, built once at import
+_BASE_CONVERSE_PARAMS = {
+    "modelId": modelId,
+    "inferenceConfig": {
         "temperature": 0.0
-    }
-    tools = {
+    },
+    "toolConfig": {
         "tools": tool_list
     }
-    
+}
+
+# Number of recent chat messages sent along with each prompt
+HISTORY_WINDOW = 3
+
+def format_chat_history(chat_history):
+    # Slicing bounds the work to the window regardless of conversation length
+    if not chat_history:
+        return ""
+    return "".join(f"{message['role']}: {message['content']}\n"
+                   for message in chat_history[-HISTORY_WINDOW:])
+
+# Function to fetch a response from the model
+def get_completion(prompt, chat_history=None, system_prompt=None):
     # Format the chat history to include in the prompt
-    history_context = ""
-    if chat_history and len(chat_history) > 0:
-        # Get last 3 messages or fewer if there aren't 3 yet
-        recent_messages = chat_history[-3:] if len(chat_history) > 3 else chat_history
-        for message in recent_messages:
-            history_context += f"{message['role']}: {message['content']}\n"
+    history_context = format_chat_history(chat_history)
     
     # Combine history with the current prompt
     full_prompt = f"{history_context}\n{prompt}" if history_context else prompt
     
     converse_api_params = {
-        "modelId": modelId,
-        "messages": [{"role": "user", "content": [{"text": full_prompt}]}],
-        "inferenceConfig": inference_config,
-        "toolConfig": tools
+        **_BASE_CONVERSE_PARAMS,
+        "messages": [{"role": "user", "content": [{"text": full_prompt}]}]
     }
     if system_prompt:
         converse_api_params["system"] = [{"text": system_prompt}]
@@ -185,17 +202,18 @@ def get_completion(prompt, chat_history=None, system_prompt=None):
 
         response_content_blocks = response_message['content']
 
-        content_block = next((block for block in response_content_blocks if 'toolUse' in block), None)
-
-        tool_use_block = content_block['toolUse']
+        # Use the first tool call; a plain-text reply has no toolUse block at all
+        for block in response_content_blocks:
+            if 'toolUse' in block:
+                tool_result_dict = block['toolUse']['input']
+                if "response" in tool_result_dict:
+                    return tool_result_dict
+                break
 
-        tool_result_dict = tool_use_block['input']
-        
-        if "response" in tool_result_dict:
-            return tool_result_dict
+        # Fall back to the reply's text so callers always get a string
         return {
             "request_type": "generic_request",
-            "response": response_message
+            "response": "".join(block.get("text", "") for block in response_content_blocks)
         }
 
     except ClientError as err: